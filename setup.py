@@ -23,6 +23,7 @@ setuptools.setup(
     package_data={"qbusmqttapi": ["py.typed"]},
     python_requires=">=3.8",
     # Requirements
+    extras_require={"speedups": ["orjson"]},
     long_description=Path("README.md").read_text(),
     long_description_content_type="text/markdown",
 )
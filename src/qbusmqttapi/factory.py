@@ -2,34 +2,52 @@
 
 import json
 import logging
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
 from typing import Any, TypeVar
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
 from .const import (
+    KEY_OUTPUT_ACTION,
+    KEY_OUTPUT_ID,
+    KEY_OUTPUT_PROPERTIES,
+    KEY_OUTPUT_TYPE,
     KEY_PROPERTIES_AUTHKEY,
     TOPIC_PREFIX,
 )
 from .discovery import QbusDiscovery, QbusMqttDevice
 from .state import (
+    STATE_ACTION_ACTIVATE,
+    STATE_TYPE_ACTION,
     QbusMqttDeviceState,
     QbusMqttGatewayState,
     QbusMqttState,
-    StateAction,
-    StateType,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-type PublishPayloadType = str | bytes | int | float | None
-type ReceivePayloadType = str | bytes | bytearray
+# Maximum number of payload bytes included in log messages.
+_MAX_LOGGED_PAYLOAD = 256
+
+# Raw MQTT payload bytes are preferred, they are parsed without decoding them to str first.
+type ReceivePayloadType = str | bytes | bytearray | memoryview
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QbusMqttRequestMessage:
     """Qbus MQTT request data class."""
 
     topic: str
-    payload: PublishPayloadType
+    payload: bytes
 
 
 class QbusMqttMessageFactory:
@@ -38,23 +56,24 @@ class QbusMqttMessageFactory:
     T = TypeVar("T", bound="QbusMqttState")
 
     def __init__(self) -> None:
-        self._topic_factory = QbusMqttTopicFactory()
+        self._topic_factory = TOPIC_FACTORY
 
     def parse_gateway_state(self, payload: ReceivePayloadType) -> QbusMqttGatewayState | None:
         """Parse an MQTT message and return an instance
         of QbusMqttGatewayState if successful, otherwise None."""
 
-        return self.deserialize(QbusMqttGatewayState, payload)
+        return _deserialize(QbusMqttGatewayState, payload)
 
     def parse_discovery(self, payload: ReceivePayloadType) -> QbusDiscovery | None:
         """Parse an MQTT message and return an instance
         of QbusDiscovery if successful, otherwise None."""
 
-        discovery: QbusDiscovery | None = self.deserialize(QbusDiscovery, payload)
+        discovery: QbusDiscovery | None = _deserialize(QbusDiscovery, payload)
 
         # Discovery data must include the Qbus device type and name.
         if discovery is not None and len(discovery.devices) == 0:
-            _LOGGER.error("Incomplete discovery payload: %s", payload)
+            if _LOGGER.isEnabledFor(logging.ERROR):
+                _LOGGER.error("Incomplete discovery payload: %s", _truncate(payload))
             return None
 
         return discovery
@@ -63,31 +82,28 @@ class QbusMqttMessageFactory:
         """Parse an MQTT message and return an instance
         of QbusMqttDeviceState if successful, otherwise None."""
 
-        return self.deserialize(QbusMqttDeviceState, payload)
+        return _deserialize(QbusMqttDeviceState, payload)
 
     def parse_output_state(self, cls: type[T], payload: ReceivePayloadType) -> T | None:
         """Parse an MQTT message and return an instance
         of T if successful, otherwise None."""
 
-        return self.deserialize(cls, payload)
+        return _deserialize(cls, payload)
 
     def create_device_activate_request(self, device: QbusMqttDevice, prefix: str = TOPIC_PREFIX) -> QbusMqttRequestMessage:
         """Create a message to request device activation."""
-        state = QbusMqttState(id=device.id, type=StateType.ACTION, action=StateAction.ACTIVATE)
-        state.write_property(KEY_PROPERTIES_AUTHKEY, "ubielite")
-
         return QbusMqttRequestMessage(
             self._topic_factory.get_device_command_topic(device.id, prefix),
-            self.serialize(state),
+            _ACTIVATE_PAYLOAD_TMPL % _dumps(device.id),
         )
 
     def create_device_state_request(self, device: QbusMqttDevice, prefix: str = TOPIC_PREFIX) -> QbusMqttRequestMessage:
         """Create a message to request a device state."""
-        return QbusMqttRequestMessage(self._topic_factory.get_get_state_topic(prefix), json.dumps([device.id]))
+        return QbusMqttRequestMessage(self._topic_factory.get_get_state_topic(prefix), _encode_device_id(device.id))
 
     def create_state_request(self, ids: list[str], prefix: str = TOPIC_PREFIX) -> QbusMqttRequestMessage:
         """Create a message to request states."""
-        return QbusMqttRequestMessage(self._topic_factory.get_get_state_topic(prefix), json.dumps(ids))
+        return QbusMqttRequestMessage(self._topic_factory.get_get_state_topic(prefix), _encode_id_list(ids))
 
     def create_set_output_state_request(
         self, device: QbusMqttDevice, state: QbusMqttState, prefix: str = TOPIC_PREFIX
@@ -98,67 +114,151 @@ class QbusMqttMessageFactory:
             self.serialize(state),
         )
 
-    def serialize(self, obj: Any) -> str:
+    def serialize(self, obj: Any) -> bytes:
         """Convert an object to json payload."""
-        return json.dumps(obj, cls=IgnoreNoneJsonEncoder)
+        return _dumps(obj)
 
     def deserialize(self, state_cls: type[Any], payload: ReceivePayloadType) -> Any | None:
         """Parse an MQTT message and return the requested type if successful, otherwise None."""
-
-        if payload is None:
-            _LOGGER.warning("Empty state payload for %s", state_cls.__name__)
-            return None
-
-        try:
-            data = json.loads(payload)
-        except ValueError:
-            _LOGGER.error("Invalid state payload for %s: %s", state_cls.__name__, payload)
-            return None
-
-        return state_cls(data)
+        return _deserialize(state_cls, payload)
 
 
 class QbusMqttTopicFactory:
     """Factory methods for topics of the Qbus MQTT API."""
 
-    def get_gateway_state_topic(self, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_gateway_state_topic(prefix: str = TOPIC_PREFIX) -> str:
         """Return the gateway state topic."""
         return f"{prefix}/state"
 
-    def get_get_config_topic(self, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_get_config_topic(prefix: str = TOPIC_PREFIX) -> str:
         """Return the getConfig topic."""
         return f"{prefix}/getConfig"
 
-    def get_config_topic(self, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_config_topic(prefix: str = TOPIC_PREFIX) -> str:
         """Return the config topic."""
         return f"{prefix}/config"
 
-    def get_get_state_topic(self, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_get_state_topic(prefix: str = TOPIC_PREFIX) -> str:
         """Return the getState topic."""
         return f"{prefix}/getState"
 
-    def get_device_state_topic(self, device_id: str, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_device_state_topic(device_id: str, prefix: str = TOPIC_PREFIX) -> str:
         """Return the state topic."""
         return f"{prefix}/{device_id}/state"
 
-    def get_device_command_topic(self, device_id: str, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_device_command_topic(device_id: str, prefix: str = TOPIC_PREFIX) -> str:
         """Return the 'set state' topic."""
         return f"{prefix}/{device_id}/setState"
 
-    def get_output_command_topic(self, device_id: str, entity_id: str, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_output_command_topic(device_id: str, entity_id: str, prefix: str = TOPIC_PREFIX) -> str:
         """Return the 'set state' topic of an output."""
         return f"{prefix}/{device_id}/{entity_id}/setState"
 
-    def get_output_state_topic(self, device_id: str, entity_id: str, prefix: str = TOPIC_PREFIX) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_output_state_topic(device_id: str, entity_id: str, prefix: str = TOPIC_PREFIX) -> str:
         """Return the state topic of an output."""
         return f"{prefix}/{device_id}/{entity_id}/state"
 
 
-class IgnoreNoneJsonEncoder(json.JSONEncoder):
-    """A json encoder to ignore None values when serializing."""
+TOPIC_FACTORY = QbusMqttTopicFactory()
+
+
+def _deserialize(state_cls: type[Any], payload: ReceivePayloadType) -> Any | None:
+    """Parse an MQTT message and return the requested type if successful, otherwise None."""
+
+    if payload is None:
+        if _LOGGER.isEnabledFor(logging.WARNING):
+            _LOGGER.warning("Empty state payload for %s", state_cls.__name__)
+        return None
+
+    try:
+        data = _loads(payload)
+    except ValueError:
+        if _LOGGER.isEnabledFor(logging.ERROR):
+            _LOGGER.error("Invalid state payload for %s: %s", state_cls.__name__, _truncate(payload))
+        return None
+
+    return state_cls(data)
+
+
+def _truncate(payload: ReceivePayloadType) -> str | bytes | bytearray:
+    """Return the start of a payload for logging."""
+    payload = payload[:_MAX_LOGGED_PAYLOAD]
+    return payload.tobytes() if isinstance(payload, memoryview) else payload
+
+
+# Names and getter of the serialized state fields, both derived from the same tuple.
+# attrgetter returns a tuple because the state has more than one field.
+_STATE_FIELDS = QbusMqttState._JSON_FIELDS
+_STATE_VALUES = attrgetter(*_STATE_FIELDS)
+
+
+def _ignore_none_default(o: Any) -> dict:
+    """Serialize an object to a dictionary, ignoring None values."""
+    if isinstance(o, QbusMqttState):
+        return {f: v for f, v in zip(_STATE_FIELDS, _STATE_VALUES(o)) if v is not None}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Ids made of these characters need no escaping in json.
+_SAFE_ID = re.compile(r"[\w.:-]+", re.ASCII)
+
+
+def _encode_id_list(ids: list[str]) -> bytes:
+    """Return the json payload of a list of ids."""
+    # Joining is only faster than the stdlib encoder, orjson beats it.
+    if not HAS_ORJSON and ids and all(_SAFE_ID.fullmatch(i) for i in ids):
+        return b'["' + '","'.join(ids).encode("ascii") + b'"]'
+    return _dumps(ids)
+
+
+@lru_cache(maxsize=256)
+def _encode_device_id(device_id: str) -> bytes:
+    """Return the json payload of a list containing a single id."""
+    return _encode_id_list([device_id])
+
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[ReceivePayloadType], Any]
+
+if HAS_ORJSON:
+    # Bind the default callback once, without a Python wrapper frame.
+    _dumps = partial(orjson.dumps, default=_ignore_none_default)
+    _loads = orjson.loads
+
+else:  # pragma: no cover
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_ignore_none_default, separators=(",", ":")).encode()
+
+    def _json_loads(payload: ReceivePayloadType) -> Any:
+        return json.loads(payload.tobytes() if isinstance(payload, memoryview) else payload)
+
+    _dumps = _json_dumps
+    _loads = _json_loads
+
 
-    def default(self, o):
-        if hasattr(o, "__dict__"):
-            # Filter out None values
-            return {k: v for k, v in o.__dict__.items() if v is not None}
-        return super().default(o)
+# Device activation payload, the json encoded device id is substituted for %b.
+_ACTIVATE_PAYLOAD_TMPL = _dumps(
+    {
+        KEY_OUTPUT_ID: "%b",
+        KEY_OUTPUT_TYPE: STATE_TYPE_ACTION,
+        KEY_OUTPUT_ACTION: STATE_ACTION_ACTIVATE,
+        KEY_OUTPUT_PROPERTIES: {KEY_PROPERTIES_AUTHKEY: "ubielite"},
+    }
+).replace(b'"%b"', b"%b", 1)
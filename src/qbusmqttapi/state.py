@@ -1,7 +1,7 @@
 """Qbus state models."""
 
-from enum import StrEnum
-from typing import Any
+import sys
+from typing import Any, Final, Generic, Self, TypeVar, overload
 
 from .const import (
     KEY_OUTPUT_ACTION,
@@ -23,24 +23,66 @@ KEY_GATEWAY_ID = "id"
 KEY_GATEWAY_ONLINE = "online"
 KEY_GATEWAY_REASON = "reason"
 
+STATE_TYPE_ACTION: Final[str] = sys.intern("action")
+STATE_TYPE_STATE: Final[str] = sys.intern("state")
 
-class StateType(StrEnum):
+STATE_ACTION_ACTIVATE: Final[str] = sys.intern("activate")
+STATE_ACTION_ACTIVE: Final[str] = sys.intern("active")
+
+# Shared empty properties, must never be mutated.
+_EMPTY: dict = {}
+
+
+_T = TypeVar("_T")
+
+
+class _PropertyField(Generic[_T]):
+    """Attribute style alias for a state property, equivalent to the read_/write_ methods."""
+
+    __slots__ = ("default", "key")
+
+    def __init__(self, key: str, default: _T) -> None:
+        self.key = key
+        self.default = default
+
+    @overload
+    def __get__(self, obj: None, owner: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, obj: "QbusMqttState", owner: type | None = None) -> _T: ...
+
+    def __get__(self, obj: "QbusMqttState | None", owner: type | None = None) -> "_T | Self":
+        if obj is None:
+            return self
+        return (obj.properties or _EMPTY).get(self.key, self.default)
+
+    def __set__(self, obj: "QbusMqttState", value: _T) -> None:
+        properties = obj.properties
+        if properties is None:
+            properties = obj.properties = {}
+
+        properties[self.key] = value
+
+
+class StateType:
     """Values to be used as state type."""
 
-    ACTION = "action"
-    STATE = "state"
+    ACTION: Final[str] = STATE_TYPE_ACTION
+    STATE: Final[str] = STATE_TYPE_STATE
 
 
-class StateAction(StrEnum):
+class StateAction:
     """Values to be used as state action."""
 
-    ACTIVATE = "activate"
-    ACTIVE = "active"
+    ACTIVATE: Final[str] = STATE_ACTION_ACTIVATE
+    ACTIVE: Final[str] = STATE_ACTION_ACTIVE
 
 
 class QbusMqttGatewayState:
     """MQTT representation of a Qbus gateway state."""
 
+    __slots__ = ("id", "online", "reason")
+
     def __init__(self, data: dict) -> None:
         """Initialize based on a json loaded dictionary."""
         self.id: str | None = data.get(KEY_GATEWAY_ID)
@@ -51,6 +93,8 @@ class QbusMqttGatewayState:
 class QbusMqttDeviceStateProperties:
     """MQTT representation of a Qbus device its state properties."""
 
+    __slots__ = ("connectable", "connected")
+
     def __init__(self, data: dict) -> None:
         """Initialize based on a json loaded dictionary."""
         self.connectable: bool | None = data.get(KEY_DEVICE_CONNECTABLE)
@@ -60,6 +104,8 @@ class QbusMqttDeviceStateProperties:
 class QbusMqttDeviceState:
     """MQTT representation of a Qbus device state."""
 
+    __slots__ = ("id", "properties")
+
     def __init__(self, data: dict) -> None:
         """Initialize based on a json loaded dictionary."""
         self.id: str | None = data.get(KEY_DEVICE_ID)
@@ -73,6 +119,11 @@ class QbusMqttDeviceState:
 class QbusMqttState:
     """MQTT representation of a Qbus state."""
 
+    __slots__ = ("action", "id", "properties", "type")
+
+    # Fields included in the json payload, in serialization order.
+    _JSON_FIELDS = ("id", "type", "action", "properties")
+
     def __init__(
         self,
         data: dict | None = None,
@@ -82,78 +133,62 @@ class QbusMqttState:
         action: str | None = None,
     ) -> None:
         """Initialize state."""
-        self.id: str = ""
-        self.type: str = ""
-        self.action: str | None = None
-        self.properties: dict | None = None
-
-        if data is not None:
-            self.id = data.get(KEY_OUTPUT_ID, "")
-            self.type = data.get(KEY_OUTPUT_TYPE, "")
-            self.action = data.get(KEY_OUTPUT_ACTION)
-            self.properties = data.get(KEY_OUTPUT_PROPERTIES)
-
-        if id is not None:
-            self.id = id
-
-        if type is not None:
-            self.type = type
-
-        if action is not None:
-            self.action = action
+        self.id: str = id if id is not None else (data.get(KEY_OUTPUT_ID, "") if data else "")
+        self.type: str = type if type is not None else (data.get(KEY_OUTPUT_TYPE, "") if data else "")
+        self.action: str | None = action if action is not None else (data.get(KEY_OUTPUT_ACTION) if data else None)
+        self.properties: dict | None = data.get(KEY_OUTPUT_PROPERTIES) if data else None
 
     def read_property(self, key: str, default: Any) -> Any:
         """Read a property."""
-        return self.properties.get(key, default) if self.properties else default
+        return (self.properties or _EMPTY).get(key, default)
 
     def write_property(self, key: str, value: Any) -> None:
         """Add or update a property."""
-        if self.properties is None:
-            self.properties = {}
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
 
-        self.properties[key] = value
+        properties[key] = value
 
 
 class QbusMqttOnOffState(QbusMqttState):
     """MQTT representation of a Qbus on/off output."""
 
-    def __init__(
-        self,
-        data: dict | None = None,
-        *,
-        id: str | None = None,
-        type: str | None = None,
-    ) -> None:
-        super().__init__(data, id=id, type=type)
+    __slots__ = ()
+
+    value: _PropertyField[bool] = _PropertyField(KEY_PROPERTIES_VALUE, False)
 
     def read_value(self) -> bool:
         """Read the value of the Qbus output."""
-        return self.read_property(KEY_PROPERTIES_VALUE, False)
+        return (self.properties or _EMPTY).get(KEY_PROPERTIES_VALUE, False)
 
     def write_value(self, on: bool) -> None:
         """Set the Qbus output on or off."""
-        self.write_property(KEY_PROPERTIES_VALUE, on)
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
+
+        properties[KEY_PROPERTIES_VALUE] = on
 
 
 class QbusMqttAnalogState(QbusMqttState):
     """MQTT representation of a Qbus analog output."""
 
-    def __init__(
-        self,
-        data: dict | None = None,
-        *,
-        id: str | None = None,
-        type: str | None = None,
-    ) -> None:
-        super().__init__(data, id=id, type=type)
+    __slots__ = ()
+
+    percentage: _PropertyField[float] = _PropertyField(KEY_PROPERTIES_VALUE, 0)
 
     def read_percentage(self) -> float:
         """Read the value of the Qbus output."""
-        return self.read_property(KEY_PROPERTIES_VALUE, 0)
+        return (self.properties or _EMPTY).get(KEY_PROPERTIES_VALUE, 0)
 
     def write_percentage(self, percentage: float) -> None:
         """Set the value of the Qbus output."""
-        self.write_property(KEY_PROPERTIES_VALUE, percentage)
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
+
+        properties[KEY_PROPERTIES_VALUE] = percentage
 
     def write_on_off(self, on: bool) -> None:
         """Set the Qbus output on or off."""
@@ -163,35 +198,44 @@ class QbusMqttAnalogState(QbusMqttState):
 class QbusMqttShutterState(QbusMqttState):
     """MQTT representation of a Qbus shutter output."""
 
-    def __init__(
-        self,
-        data: dict | None = None,
-        *,
-        id: str | None = None,
-        type: str | None = None,
-    ) -> None:
-        super().__init__(data, id=id, type=type)
+    __slots__ = ()
+
+    state: _PropertyField[str | None] = _PropertyField(KEY_PROPERTIES_STATE, None)
+    position: _PropertyField[int | None] = _PropertyField(KEY_PROPERTIES_SHUTTER_POSITION, None)
+    slat_position: _PropertyField[int | None] = _PropertyField(KEY_PROPERTIES_SLAT_POSITION, None)
 
     def read_state(self) -> str | None:
         """Read the state of the Qbus output."""
-        return self.read_property(KEY_PROPERTIES_STATE, None)
+        return (self.properties or _EMPTY).get(KEY_PROPERTIES_STATE, None)
 
     def write_state(self, state: str) -> None:
         """Set the state of the Qbus output."""
-        self.write_property(KEY_PROPERTIES_STATE, state)
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
+
+        properties[KEY_PROPERTIES_STATE] = state
 
     def read_position(self) -> int | None:
         """Read the position of the Qbus output."""
-        return self.read_property(KEY_PROPERTIES_SHUTTER_POSITION, None)
+        return (self.properties or _EMPTY).get(KEY_PROPERTIES_SHUTTER_POSITION, None)
 
     def write_position(self, percentage: int) -> None:
         """Set the position of the Qbus output."""
-        self.write_property(KEY_PROPERTIES_SHUTTER_POSITION, percentage)
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
+
+        properties[KEY_PROPERTIES_SHUTTER_POSITION] = percentage
 
     def read_slat_position(self) -> int | None:
         """Read the slat position of the Qbus output."""
-        return self.read_property(KEY_PROPERTIES_SLAT_POSITION, None)
+        return (self.properties or _EMPTY).get(KEY_PROPERTIES_SLAT_POSITION, None)
 
     def write_slat_position(self, percentage: int) -> None:
         """Set the slat position of the Qbus output."""
-        self.write_property(KEY_PROPERTIES_SLAT_POSITION, percentage)
+        properties = self.properties
+        if properties is None:
+            properties = self.properties = {}
+
+        properties[KEY_PROPERTIES_SLAT_POSITION] = percentage
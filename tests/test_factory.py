@@ -0,0 +1,161 @@
+"""Tests for the Qbus MQTT message factory."""
+
+import importlib
+import json
+import logging
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+
+import pytest
+
+from qbusmqttapi import factory
+from qbusmqttapi.discovery import QbusMqttDevice
+from qbusmqttapi.factory import QbusMqttMessageFactory
+from qbusmqttapi.state import QbusMqttOnOffState, QbusMqttState, StateAction, StateType
+
+
+@pytest.mark.parametrize("payload", ["garbage", b"garbage", bytearray(b"garbage"), memoryview(b"garbage")])
+def test_parse_output_state_invalid_payload(payload, caplog: pytest.LogCaptureFixture) -> None:
+    """An invalid payload is logged and None is returned."""
+    factory = QbusMqttMessageFactory()
+
+    with caplog.at_level(logging.ERROR):
+        assert factory.parse_output_state(QbusMqttOnOffState, payload) is None
+
+    assert "Invalid state payload for QbusMqttOnOffState" in caplog.text
+
+
+@pytest.mark.parametrize("payload", ['{"app":"x","devices":[]}', b'{"app":"x","devices":[]}'])
+def test_parse_discovery_incomplete_payload(payload, caplog: pytest.LogCaptureFixture) -> None:
+    """A discovery payload without devices is logged and None is returned."""
+    factory = QbusMqttMessageFactory()
+
+    with caplog.at_level(logging.ERROR):
+        assert factory.parse_discovery(payload) is None
+
+    assert "Incomplete discovery payload" in caplog.text
+
+
+def test_parse_output_state_str_payload() -> None:
+    """A str payload is parsed."""
+    factory = QbusMqttMessageFactory()
+
+    state = factory.parse_output_state(QbusMqttOnOffState, '{"id":"UL1","type":"state","properties":{"value":true}}')
+
+    assert state is not None
+    assert state.id == "UL1"
+    assert state.read_value() is True
+
+
+@pytest.fixture(params=["orjson", "json"])
+def factory_module(request: pytest.FixtureRequest) -> Iterator[ModuleType]:
+    """Return the factory module, loaded with orjson or with the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield factory
+        return
+
+    saved = sys.modules.get("orjson")
+    sys.modules["orjson"] = None  # type: ignore[assignment]
+    try:
+        module = importlib.reload(factory)
+        assert not module.HAS_ORJSON
+        yield module
+    finally:
+        if saved is None:
+            del sys.modules["orjson"]
+        else:
+            sys.modules["orjson"] = saved
+        importlib.reload(factory)
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        ["UL1"],
+        ["3f2b6a1e-0c4d-4e8a-9b7f-2d1c5e6f7a80", "UL2", "UL3"],
+        [],
+        ['x"y', "UL1"],
+        ["x\\y"],
+        ["ünïcödé"],
+    ],
+)
+def test_create_state_request_payload(factory_module: ModuleType, ids: list[str]) -> None:
+    """The state request payload is the json list of ids."""
+    message = factory_module.QbusMqttMessageFactory().create_state_request(ids)
+
+    assert isinstance(message.payload, bytes)
+    assert json.loads(message.payload) == ids
+
+
+@pytest.mark.parametrize("device_id", ["UL1", 'a"b', "100%s", "ünïcödé"])
+def test_create_device_activate_request_payload(factory_module: ModuleType, device_id: str) -> None:
+    """The activation payload matches the serialized activation state."""
+    message_factory = factory_module.QbusMqttMessageFactory()
+    state = QbusMqttState(id=device_id, type=StateType.ACTION, action=StateAction.ACTIVATE)
+    state.write_property("authKey", "ubielite")
+
+    message = message_factory.create_device_activate_request(QbusMqttDevice({"id": device_id}))
+
+    assert message.topic == f"cloudapp/QBUSMQTTGW/{device_id}/setState"
+    assert message.payload == message_factory.serialize(state)
+    assert json.loads(message.payload) == {
+        "id": device_id,
+        "type": "action",
+        "action": "activate",
+        "properties": {"authKey": "ubielite"},
+    }
+
+
+def test_create_device_state_request_payload(factory_module: ModuleType) -> None:
+    """The device state request payload is a json list with the device id."""
+    message = factory_module.QbusMqttMessageFactory().create_device_state_request(QbusMqttDevice({"id": "UL1"}))
+
+    assert message.topic == "cloudapp/QBUSMQTTGW/getState"
+    assert message.payload == b'["UL1"]'
+
+
+def test_serialize_state(factory_module: ModuleType) -> None:
+    """A state serializes to compact json bytes without None fields."""
+    state = QbusMqttOnOffState(id="UL1", type="state")
+
+    payload = factory_module.QbusMqttMessageFactory().serialize(state)
+
+    assert payload == b'{"id":"UL1","type":"state"}'
+
+
+def test_serialize_state_with_properties(factory_module: ModuleType) -> None:
+    """Set action and properties are included."""
+    state = QbusMqttOnOffState(id="UL1", type="state", action="on")
+    state.write_value(True)
+
+    payload = factory_module.QbusMqttMessageFactory().serialize(state)
+
+    assert payload == b'{"id":"UL1","type":"state","action":"on","properties":{"value":true}}'
+
+
+def test_serialize_unsupported_object(factory_module: ModuleType) -> None:
+    """Objects other than states are not serialized."""
+    with pytest.raises(TypeError):
+        factory_module.QbusMqttMessageFactory().serialize(object())
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        '{"id":"UL1","type":"state","properties":{"value":true}}',
+        b'{"id":"UL1","type":"state","properties":{"value":true}}',
+        bytearray(b'{"id":"UL1","type":"state","properties":{"value":true}}'),
+        memoryview(b'{"id":"UL1","type":"state","properties":{"value":true}}'),
+    ],
+)
+def test_parse_output_state(factory_module: ModuleType, payload: object) -> None:
+    """A valid payload is parsed into the requested state class."""
+    state = factory_module.QbusMqttMessageFactory().parse_output_state(QbusMqttOnOffState, payload)
+
+    assert isinstance(state, QbusMqttOnOffState)
+    assert state.id == "UL1"
+    assert state.type == "state"
+    assert state.action is None
+    assert state.read_value() is True
@@ -0,0 +1,46 @@
+"""Tests for the Qbus state models."""
+
+from qbusmqttapi.state import (
+    QbusMqttAnalogState,
+    QbusMqttOnOffState,
+    QbusMqttShutterState,
+)
+
+
+def test_property_field_default() -> None:
+    """Unset properties read as their default."""
+    assert QbusMqttOnOffState(id="UL1").value is False
+    assert QbusMqttAnalogState(id="UL1").percentage == 0
+    assert QbusMqttShutterState(id="UL1").position is None
+
+
+def test_property_field_set_without_properties() -> None:
+    """Setting a property creates the properties dictionary."""
+    state = QbusMqttOnOffState(id="UL1")
+    assert state.properties is None
+
+    state.value = True
+
+    assert state.properties == {"value": True}
+    assert state.value is True
+    assert state.read_value() is True
+
+
+def test_property_field_matches_methods() -> None:
+    """The attribute and the read_/write_ methods use the same property."""
+    state = QbusMqttShutterState({"id": "UL1", "properties": {"shutterPosition": 40}})
+    assert state.position == state.read_position() == 40
+
+    state.write_slat_position(10)
+    assert state.slat_position == 10
+
+    state.state = "up"
+    assert state.read_state() == "up"
+
+
+def test_property_field_class_access() -> None:
+    """Accessing the attribute on the class returns the descriptor."""
+    descriptor = QbusMqttOnOffState.value
+
+    assert descriptor.key == "value"
+    assert descriptor.default is False